@@ -1,167 +1,394 @@
-from typing import Any, Dict, List, Optional
-
-from fastapi import FastAPI
-from fastapi.routing import APIRoute
+import functools
+import io
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from fastapi_llms_txt.models import ProjectDescription
 
+if TYPE_CHECKING:
+    # Only needed for annotations; skipping the runtime imports keeps the
+    # module cheap to import on its own.
+    from fastapi import FastAPI
+    from fastapi.routing import APIRoute
+
+# Lazily imported APIRoute class; populated on first route traversal so
+# importing this module doesn't pull in FastAPI/Starlette.
+_APIRoute = None
+
+
+def _api_route_type() -> type:
+    global _APIRoute
+    if _APIRoute is None:
+        from fastapi.routing import APIRoute
+
+        _APIRoute = APIRoute
+    return _APIRoute
+
 # Constants
-SERVE_LLMS_TXT = "serve_llms_txt"
+# Interned so comparisons against route/function names (interned by CPython)
+# take the pointer-identity fast path inside ==/!=.
+SERVE_LLMS_TXT = sys.intern("serve_llms_txt")
 DEFAULT_HTTP_METHOD = "GET"
 
+# Endpoint names excluded from the generated docs; frozenset so membership
+# is a single hash probe and new exclusions are one entry away.
+_EXCLUDED_ENDPOINT_NAMES = frozenset({SERVE_LLMS_TXT})
+
+# Pre-built header fragments (header line plus trailing blank line)
+_API_SECTION_HEADER = ("## API Endpoints", "")
+_PARAMS_HEADER = ("**Parameters:**", "")
+
+# Reused line templates; one compiled format spec shared across all routes
+# instead of per-iteration f-string bytecode.
+_ROUTE_HEADER_TMPL = "### {methods} {path}"
+_PARAM_TMPL = "- `{name}` ({type}, {req}): {desc}"
+
+# Matches the noise around type reprs: "typing." prefixes and "<class '...'>"
+# wrappers, all of which are stripped from the documented type.
+_TYPE_CLEAN_RE = re.compile(r"typing\.|<class '|'>")
+
+# Matches "{param_name}" placeholders in route paths.
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
+# Display types for Starlette path convertors, keyed by class name so custom
+# convertors fall back to "str" without imports.
+_CONVERTOR_TYPES = {
+    "StringConvertor": "str",
+    "PathConvertor": "str",
+    "IntegerConvertor": "int",
+    "FloatConvertor": "float",
+    "UUIDConvertor": "UUID",
+}
+
+# Canonical method strings shared across routes with the same method set,
+# e.g. thousands of {"GET"} routes reuse one "GET" string.
+_METHODS_STR_CACHE: Dict[frozenset, str] = {}
+
+
+def _methods_str(methods: Any) -> str:
+    """Return a canonical ", "-joined string for a route's methods."""
+    if not methods:
+        return DEFAULT_HTTP_METHOD
+    key = frozenset(methods)
+    methods_str = _METHODS_STR_CACHE.get(key)
+    if methods_str is None:
+        methods_str = ", ".join(sorted(key))
+        _METHODS_STR_CACHE[key] = methods_str
+    return methods_str
+
+
+# Maps slug separators to spaces in a single translate pass
+_SLUG_TRANS = str.maketrans({"_": " ", "-": " "})
+
+
+@functools.lru_cache(maxsize=1024)
+def _humanize_segment(segment: str) -> str:
+    """Turn a snake_case or kebab-case segment into a title-cased name."""
+    return segment.translate(_SLUG_TRANS).title()
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_from(func_name: str, path: str) -> str:
+    """Derive a human-readable endpoint name from a function name or path."""
+    # Skip llms.txt endpoints
+    if func_name == SERVE_LLMS_TXT:
+        return ""
+
+    if func_name:
+        return _humanize_segment(func_name)
+    if path:
+        parts = [p for p in path.split("/") if p and not p.startswith("{")]
+        if parts:
+            return _humanize_segment(parts[-1])
+    return ""
+
+
+@functools.lru_cache(maxsize=512)
+def _clean_type(type_repr: str) -> str:
+    """Clean up a type string (remove typing. prefix, class wrapper, etc.)."""
+    return _TYPE_CLEAN_RE.sub("", type_repr)
+
+
+class _Param:
+    """Compact parameter record.
+
+    Uses __slots__ instead of a per-parameter dict to cut allocation size,
+    while keeping dict-style access (param["name"], param.get("type")) for
+    existing consumers.
+    """
+
+    __slots__ = ("name", "required", "type", "description")
+
+    def __init__(self, name: str, required: bool, type: str, description: str):
+        self.name = name
+        self.required = required
+        self.type = type
+        self.description = description
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+def _type_name(tp: Any) -> str:
+    """Return a clean display name for a parameter type.
+
+    Plain classes (the common case: int, str, models) already expose the
+    clean name via __name__; only generics and other reprs need stringifying
+    and cleanup.
+    """
+    if isinstance(tp, type):
+        return tp.__name__
+    return _clean_type(str(tp))
+
 
 class LLMsTxtGenerator:
     """Generates llms.txt content from project description."""
 
     def __init__(
-        self, project_description: ProjectDescription, app: Optional[FastAPI] = None
+        self, project_description: ProjectDescription, app: Optional["FastAPI"] = None
     ):
         self.project_description = project_description
         self.app = app
+        # Fingerprint of the (frozen) project description, computed once so
+        # the render cache also reacts to a swapped-in description.
+        self._project_fingerprint = hash(
+            (
+                project_description.title,
+                project_description.summary,
+                tuple(project_description.notes or ()),
+                tuple(
+                    (name, tuple((link.title, str(link.url)) for link in links))
+                    for name, links in project_description.sections.items()
+                ),
+            )
+        )
+        # Cached rendered content plus the key it was built from; regenerated
+        # only when the app's routes or the project description change.
+        self._cache: Optional[Tuple[Any, str]] = None
+        # Same idea for the API docs block, cached independently so direct
+        # _generate_api_docs callers also hit it.
+        self._api_docs_cache: Optional[
+            Tuple[Optional[Tuple[int, int]], Tuple[str, ...]]
+        ] = None
+        # Filtered route list, also keyed by the route-table signature
+        self._routes_cache: Optional[
+            Tuple[Optional[Tuple[int, int]], List["APIRoute"]]
+        ] = None
+        # Display strings per parameter type object, keyed by id() since
+        # mock types may not be hashable
+        self._type_str_cache: Dict[int, str] = {}
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached rendering so the next generate() call rebuilds it.
+
+        Route additions and removals are detected automatically; this is only
+        needed after mutating routes or the project description in place.
+        """
+        self._cache = None
+        self._api_docs_cache = None
+        self._routes_cache = None
+
+    def _routes_signature(self) -> Optional[Tuple[int, int]]:
+        """Return a cheap fingerprint of the app's route table."""
+        if not self.app:
+            return None
+        routes = self.app.routes
+        return (len(routes), hash(tuple(id(route) for route in routes)))
 
     def generate(self) -> str:
         """Generate llms.txt content in the specified format."""
-        content = [
-            f"# {self.project_description.title}",
-            "",
-            f"{self.project_description.summary}",
-            "",
-        ]
+        cache_key = (self._project_fingerprint, self._routes_signature())
+        if self._cache is not None and self._cache[0] == cache_key:
+            return self._cache[1]
+
+        # Write whole blocks (each terminated by a blank line) into a single
+        # buffer instead of accumulating per-line list entries.
+        buf = io.StringIO()
+        buf.write(
+            f"# {self.project_description.title}\n\n"
+            f"{self.project_description.summary}\n\n"
+        )
 
         # Add notes
         if self.project_description.notes:
-            for note in self.project_description.notes:
-                content.append(f"- {note}")
-            content.append("")
+            buf.write(
+                "".join(f"- {note}\n" for note in self.project_description.notes)
+            )
+            buf.write("\n")
 
         # Add API endpoints documentation if app is provided
         if self.app:
             api_docs = self._generate_api_docs()
             if api_docs:
-                content.extend(api_docs)
-
-        # Add sections
-        for section_name, links in self.project_description.sections.items():
-            content.append(f"## {section_name}")
-            content.append("")
-            for link in links:
-                content.append(f"- [{link.title}]({link.url})")
-            content.append("")
+                buf.write("\n".join(api_docs))
+                buf.write("\n")
+
+        # Add sections, joined from a generator in one write
+        buf.write(
+            "".join(
+                f"## {section_name}\n\n"
+                + "".join(f"- [{link.title}]({link.url})\n" for link in links)
+                + "\n"
+                for section_name, links in self.project_description.sections.items()
+            )
+        )
 
-        return "\n".join(content)
+        result = buf.getvalue().rstrip("\n") + "\n"
+        self._cache = (cache_key, result)
+        return result
 
     def _generate_api_docs(self) -> List[str]:
         """Generate documentation for API endpoints from FastAPI app."""
         if not self.app:
             return []
 
-        content = ["## API Endpoints", ""]
-
-        routes = self._get_all_routes()
-        if not routes:
-            return []
+        signature = self._routes_signature()
+        if self._api_docs_cache is not None and self._api_docs_cache[0] == signature:
+            # Hand out a fresh list so callers can't mutate the cached copy
+            return list(self._api_docs_cache[1])
+
+        entries = list(self._iter_route_doc_lines())
+
+        # Only prepend the section header if we actually added route information
+        docs = [*_API_SECTION_HEADER, *entries] if entries else []
+        self._api_docs_cache = (signature, tuple(docs))
+        return docs
+
+    def _iter_route_doc_lines(self) -> Iterator[str]:
+        """Yield markdown lines for every documented route in a single pass."""
+        for route, path, methods_str, summary, description in self._route_entries():
+            yield _ROUTE_HEADER_TMPL.format(methods=methods_str, path=path)
+            yield ""
+
+            if summary:
+                yield f"{summary}"
+                yield ""
+
+            if description:
+                yield f"{description}"
+                yield ""
+
+            # Add parameters info if available
+            params = self._get_endpoint_params(route)
+            if params:
+                yield from _PARAMS_HEADER
+                for param in params:
+                    yield _PARAM_TMPL.format(
+                        name=param["name"],
+                        type=param.get("type", ""),
+                        req="required" if param.get("required", False) else "optional",
+                        desc=param.get("description", ""),
+                    )
+                yield ""
+
+    def _route_entries(self) -> Iterator[Tuple[Any, str, str, str, str]]:
+        """Yield (route, path, methods, summary, description) tuples.
+
+        Attribute access happens once per route here so the documentation
+        loop only unpacks prebuilt tuples; yielding lazily avoids building
+        an intermediate entries list.
+        """
+        # _get_all_routes already excludes the llms.txt endpoint itself
+        for route in self._get_all_routes():
+            try:
+                path = route.path
+                if not path:  # Only process routes with a path
+                    continue
+
+                # Only fall back to deriving a name when no summary is set
+                summary = (
+                    route.summary if route.summary else self._get_endpoint_name(route)
+                )
+                entry = (
+                    route,
+                    path,
+                    _methods_str(route.methods),
+                    summary,
+                    route.description or "",
+                )
+            except AttributeError:
+                # Route subclasses missing the standard attributes are skipped
+                continue
+            yield entry
 
-        has_routes_content = False
+    def _iter_routes(self) -> Iterator["APIRoute"]:
+        """Iterate API routes lazily, excluding the llms.txt endpoint."""
+        if not self.app:
+            return
 
-        for route in routes:
+        # type-is check is a pointer compare covering the common exact-APIRoute
+        # case; isinstance keeps subclasses from mounted sub-apps working
+        api_route_type = _api_route_type()
+        for route in self.app.routes:
             if (
-                getattr(route, "name", None) != "serve_llms_txt"
-            ):  # Skip the llms.txt endpoint itself
-                path = getattr(route, "path", "")
-                methods = getattr(route, "methods", [])
-                summary = getattr(route, "summary", "") or self._get_endpoint_name(
-                    route
-                )
-                description = getattr(route, "description", "")
-
-                if path:  # Only process routes with a path
-                    has_routes_content = True
-
-                    # Convert methods to string, using default if None or empty
-                    methods_str = ", ".join(methods) if methods else DEFAULT_HTTP_METHOD
-                    content.append(f"### {methods_str} {path}")
-                    content.append("")
-
-                    if summary:
-                        content.append(f"{summary}")
-                        content.append("")
-
-                    if description:
-                        content.append(f"{description}")
-                        content.append("")
-
-                    # Add parameters info if available
-                    params = self._get_endpoint_params(route)
-                    if params:
-                        content.append("**Parameters:**")
-                        content.append("")
-                        for param in params:
-                            required = (
-                                "required"
-                                if param.get("required", False)
-                                else "optional"
-                            )
-                            param_type = param.get("type", "")
-                            description = param.get("description", "")
-                            content.append(
-                                f"- `{param['name']}` ({param_type}, {required}): {description}"
-                            )
-                        content.append("")
-
-        # Only return content if we actually added route information
-        return content if has_routes_content else []
-
-    def _get_all_routes(self) -> List[APIRoute]:
-        """Get all routes from the FastAPI app."""
-        if not self.app:
-            return []
+                type(route) is api_route_type or isinstance(route, api_route_type)
+            ) and route.name not in _EXCLUDED_ENDPOINT_NAMES:
+                yield route
 
-        # Use list comprehension for cleaner code
-        return [
-            route
-            for route in self.app.routes
-            if isinstance(route, APIRoute) and route.name != SERVE_LLMS_TXT
-        ]
+    def _get_all_routes(self) -> List["APIRoute"]:
+        """Get all routes from the FastAPI app."""
+        signature = self._routes_signature()
+        if self._routes_cache is not None and self._routes_cache[0] == signature:
+            # Hand out a fresh list so callers can't mutate the cached copy
+            return list(self._routes_cache[1])
+
+        routes = list(self._iter_routes())
+        self._routes_cache = (signature, routes)
+        return list(routes)
+
+    def _type_str(self, tp: Any) -> str:
+        """Return the display string for a type, computed once per object.
+
+        The cache lives for the generator's lifetime and route annotations
+        keep their type objects alive, so id() keys stay valid.
+        """
+        key = id(tp)
+        type_str = self._type_str_cache.get(key)
+        if type_str is None:
+            type_str = _type_name(tp)
+            self._type_str_cache[key] = type_str
+        return type_str
 
     def _get_endpoint_name(self, route: Any) -> str:
         """Get a human-readable name for an endpoint."""
-        path = getattr(route, "path", "")
         func = getattr(route, "endpoint", None)
-
-        # Check if this is the function that serves llms.txt
         func_name = getattr(func, "__name__", "") if func else ""
+        return _name_from(func_name, getattr(route, "path", ""))
 
-        # Skip llms.txt endpoints
-        if func_name == SERVE_LLMS_TXT:
-            return ""
-
-        if func_name and func_name != SERVE_LLMS_TXT:
-            return func_name.replace("_", " ").title()
-        elif path:
-            parts = [p for p in path.split("/") if p and not p.startswith("{")]
-            if parts:
-                return parts[-1].replace("_", " ").title()
-        return ""
-
-    def _get_endpoint_params(self, route: Any) -> List[Dict[str, Any]]:
+    def _get_endpoint_params(self, route: Any) -> List[_Param]:
         """Extract parameter information from an endpoint."""
-        params = []
-        param_names = set()
+        # Parameters keyed by name; dependant params take precedence over
+        # path-derived ones and insertion order is preserved.
+        params_by_name: Dict[str, _Param] = {}
 
-        # Extract path parameters from the path
+        # Extract path parameters, preferring the regex and convertors that
+        # Starlette precompiled at route construction over rescanning the path
         path_params = {}
         route_path = getattr(route, "path", "")
         if route_path and "{" in route_path:
-            path_parts = route_path.split("/")
-            for part in path_parts:
-                if part.startswith("{") and part.endswith("}"):
-                    param_name = part[1:-1]  # Remove the curly braces
-                    path_params[param_name] = {
-                        "name": param_name,
-                        "required": True,  # Path parameters are always required
-                        "type": "str",  # Default to string if we can't determine type
-                        "description": f"Path parameter: {param_name}",
-                    }
+            groupindex = getattr(
+                getattr(route, "path_regex", None), "groupindex", None
+            )
+            if isinstance(groupindex, dict) and groupindex:
+                param_names = groupindex
+                convertors = getattr(route, "param_convertors", None) or {}
+            else:
+                # Mocked or non-Starlette routes: single regex scan of the path
+                param_names = _PATH_PARAM_RE.findall(route_path)
+                convertors = {}
+            for param_name in param_names:
+                convertor = convertors.get(param_name)
+                path_params[param_name] = _Param(
+                    name=param_name,
+                    required=True,  # Path parameters are always required
+                    # Default to string if we can't determine type
+                    type=_CONVERTOR_TYPES.get(type(convertor).__name__, "str"),
+                    description=f"Path parameter: {param_name}",
+                )
 
         # Process parameters from the route's dependant (these have more information)
         route_dependant = getattr(route, "dependant", None)
@@ -176,43 +403,28 @@ class LLMsTxtGenerator:
                 continue
 
             # Get type as string, handling different representations
-            type_str = str(getattr(param, "type_", ""))
-            # Clean up type string (remove typing. prefix, class wrapper, etc.)
-            type_str = type_str.replace("typing.", "")
-            type_str = type_str.replace("<class '", "").replace("'>", "")
+            type_str = self._type_str(param.type_)
 
             # Determine if the parameter is required
-            required = getattr(param, "required", False)
+            required = param.required
 
             # Get field info and description
-            field_info = getattr(param, "field_info", None)
-            param_description = (
-                getattr(field_info, "description", "") if field_info else ""
-            )
+            field_info = param.field_info
+            param_description = field_info.description if field_info else ""
 
             # If this is a path parameter and we don't have a description, use a generic one
             if param_name in path_params and not param_description:
                 param_description = f"Path parameter: {param_name}"
 
-            param_info = {
-                "name": param_name,
-                "required": required,
-                "type": type_str,
-                "description": param_description,
-            }
-            params.append(param_info)
-            param_names.add(param_name)
+            params_by_name[param_name] = _Param(
+                name=param_name,
+                required=required,
+                type=type_str,
+                description=param_description,
+            )
 
         # Add any path parameters that weren't in the dependant params
         for name, param_info in path_params.items():
-            if name not in param_names:
-                params.append(param_info)
-
-        # Try to enhance param descriptions from docstring if available
-        endpoint = getattr(route, "endpoint", None)
-        docstring = getattr(endpoint, "__doc__", "")
-        if docstring:
-            docstring = docstring.strip()
-            # Here we could implement more sophisticated docstring parsing if needed
+            params_by_name.setdefault(name, param_info)
 
-        return params
+        return list(params_by_name.values())
@@ -1,11 +1,13 @@
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 
 
 class LinkItem(BaseModel):
     """Represents a single link item in a section."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     url: HttpUrl
 
@@ -13,6 +15,8 @@ class LinkItem(BaseModel):
 class ProjectDescription(BaseModel):
     """Schema for the project description in llms.txt."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     summary: str
     notes: Optional[List[str]] = None
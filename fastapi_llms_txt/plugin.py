@@ -1,7 +1,10 @@
+import hashlib
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.responses import PlainTextResponse
+from pydantic import TypeAdapter, ValidationError
 
 from fastapi_llms_txt.generator import LLMsTxtGenerator
 from fastapi_llms_txt.models import LinkItem, ProjectDescription
@@ -10,6 +13,14 @@ from fastapi_llms_txt.models import LinkItem, ProjectDescription
 LLMS_TXT_TAG = "LLMs.txt"
 LLMS_TXT_ENDPOINT = "/llms.txt"
 
+# Validates a whole section's links in one C-level pass
+_LINK_LIST_ADAPTER = TypeAdapter(List[LinkItem])
+
+
+def _valid_link(link: Any) -> bool:
+    """Single structural check covering None, non-dicts and missing keys."""
+    return isinstance(link, dict) and "title" in link and "url" in link
+
 
 def add_llms_txt(
     app: FastAPI,
@@ -18,6 +29,7 @@ def add_llms_txt(
     notes: Optional[List[str]] = None,
     sections: Dict[str, List[Dict[str, Any]]] = None,
     include_api_docs: bool = True,
+    include_in_schema: bool = True,
 ) -> None:
     """
     Add an /llms.txt endpoint to a FastAPI application.
@@ -29,6 +41,9 @@ def add_llms_txt(
         notes: Optional list of notes.
         sections: Dictionary of sections with lists of link items.
         include_api_docs: Whether to include API documentation in the llms.txt file.
+        include_in_schema: Whether to document the /llms.txt endpoint itself in
+            the OpenAPI schema. Disabling skips schema and tag registration,
+            which avoids the endpoint's response-model work at schema time.
     """
     if sections is None:
         sections = {}
@@ -36,17 +51,29 @@ def add_llms_txt(
     # Convert dict links to LinkItem objects with validation
     processed_sections = {}
     for section_name, links in sections.items():
+        try:
+            # Fast path: validate the whole section in one pass
+            processed_sections[section_name] = _LINK_LIST_ADAPTER.validate_python(
+                links
+            )
+            continue
+        except ValidationError:
+            pass
+
+        # Fallback: validate links one by one so valid entries survive
         section_items = []
         for link in links:
+            if not _valid_link(link):
+                # Log the error but continue processing other links
+                print(
+                    f"Error processing link in section '{section_name}': "
+                    f"link must have 'title' and 'url' keys: {link}"
+                )
+                continue
             try:
-                # Check that required keys exist
-                if "title" not in link or "url" not in link:
-                    raise ValueError(f"Link must have 'title' and 'url' keys: {link}")
                 section_items.append(LinkItem(title=link["title"], url=link["url"]))
-            except Exception as e:
-                # Log the error but continue processing other links
+            except ValidationError as e:
                 print(f"Error processing link in section '{section_name}': {e}")
-                continue
         processed_sections[section_name] = section_items
 
     project_description = ProjectDescription(
@@ -57,11 +84,33 @@ def add_llms_txt(
         project_description=project_description, app=app if include_api_docs else None
     )
 
+    # Rendered body cache: maps the generated string (by identity, since the
+    # generator caches and reuses it) to its UTF-8 encoding and ETag so the
+    # request path serves pre-encoded bytes.
+    rendered = {"text": None, "body": b"", "etag": "", "headers": {}}
+
+    def _render_body() -> bytes:
+        content = generator.generate()
+        if content is not rendered["text"]:
+            body = content.encode("utf-8")
+            rendered["text"] = content
+            rendered["body"] = body
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            rendered["etag"] = etag
+            # Response headers are identical for every request serving this
+            # body, so build the dict once per render rather than per GET
+            rendered["headers"] = {
+                "Cache-Control": "public, max-age=3600",
+                "ETag": etag,
+            }
+        return rendered["body"]
+
     router = APIRouter(tags=[LLMS_TXT_TAG])
 
     @router.get(
         LLMS_TXT_ENDPOINT,
         response_class=PlainTextResponse,
+        include_in_schema=include_in_schema,
         summary="Get llms.txt contents",
         description=(
             "Returns a plain text llms.txt file that adheres to the llms.txt specification. "
@@ -75,7 +124,7 @@ def add_llms_txt(
             }
         },
     )
-    async def serve_llms_txt():
+    async def serve_llms_txt(request: Request):
         """
         Serves the llms.txt file content.
 
@@ -83,25 +132,47 @@ def add_llms_txt(
             A plain text representation of the llms.txt file with information about the API
             that is helpful for Large Language Models.
         """
-        content = generator.generate()
-        return content
-
-    # Use FastAPI's route description to document in OpenAPI schema
-    if app.openapi_tags is None:
-        app.openapi_tags = []
-
-    # Add LLMs.txt tag description if it doesn't exist
-    llms_tag_exists = any(tag.get("name") == LLMS_TXT_TAG for tag in app.openapi_tags)
-    if not llms_tag_exists:
-        app.openapi_tags.append(
-            {
-                "name": LLMS_TXT_TAG,
-                "description": (
-                    "Endpoints related to the llms.txt specification, "
-                    "which provides information for Large Language Models "
-                    "about the purpose and capabilities of this API."
-                ),
-            }
-        )
+        body = _render_body()
+        etag = rendered["etag"]
+
+        # Let clients and caches revalidate cheaply instead of re-downloading
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return PlainTextResponse(body, headers=rendered["headers"])
+
+    # Pre-render before the server accepts connections by wrapping the app's
+    # lifespan: rendering happens after all startup handlers have run (so
+    # routes they register are included), while staying lazy for apps that
+    # never execute their lifespan (e.g. a bare TestClient).
+    existing_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def _lifespan_with_prerender(app: FastAPI):
+        async with existing_lifespan(app) as state:
+            _render_body()
+            yield state
+
+    app.router.lifespan_context = _lifespan_with_prerender
+
+    # Use FastAPI's route description to document in OpenAPI schema; skipped
+    # entirely when the endpoint is hidden from the schema
+    if include_in_schema:
+        if app.openapi_tags is None:
+            app.openapi_tags = []
+
+        # Add LLMs.txt tag description if it doesn't exist
+        existing_tag_names = {tag.get("name") for tag in app.openapi_tags}
+        if LLMS_TXT_TAG not in existing_tag_names:
+            app.openapi_tags.append(
+                {
+                    "name": LLMS_TXT_TAG,
+                    "description": (
+                        "Endpoints related to the llms.txt specification, "
+                        "which provides information for Large Language Models "
+                        "about the purpose and capabilities of this API."
+                    ),
+                }
+            )
 
     app.include_router(router)
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_llms_txt import add_llms_txt
+
+
+def _make_client(**kwargs) -> TestClient:
+    """Build a FastAPI app with add_llms_txt applied and return its client."""
+    app = FastAPI()
+    add_llms_txt(app, **kwargs)
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def basic_client() -> TestClient:
+    """Client for an app with only a title and summary (no sections)."""
+    return _make_client(title="Test API", summary="A test API for testing")
+
+
+@pytest.fixture(scope="session")
+def sections_client() -> TestClient:
+    """Client for an app with a single Documentation section."""
+    return _make_client(
+        title="Test API",
+        summary="A test API for testing",
+        sections={
+            "Documentation": [{"title": "API Docs", "url": "https://example.com/docs"}]
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def notes_client() -> TestClient:
+    """Client for an app with notes and a Documentation section."""
+    return _make_client(
+        title="Test API",
+        summary="A test API for testing",
+        notes=["Note 1", "Note 2"],
+        sections={
+            "Documentation": [{"title": "API Docs", "url": "https://example.com/docs"}]
+        },
+    )